@@ -7,10 +7,18 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 import aiohttp
+import orjson
 import asyncio
+import functools
+import hashlib
+import math
 import os
-import json
 import io
+import itertools
+import random
+import re
+import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
@@ -26,16 +34,33 @@ NWS_GRID_X = 84  # Grid coordinates for Port Huron area
 NWS_GRID_Y = 65
 NWS_API_BASE = "https://api.weather.gov"
 CHECK_INTERVAL_SECONDS = 60  # How often to check for new alerts
+FORECAST_CACHE_TTL = 300  # Seconds to reuse forecast/hourly responses
+PRODUCT_CACHE_TTL = 900  # Seconds to reuse AFD/HWO responses
+NWS_RETRY_ATTEMPTS = 4  # Attempts per NWS request before giving up
+NWS_RETRY_MAX_DELAY = 30  # Cap in seconds on the backoff between attempts
+NWS_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
 # Radar URLs (Detroit KDTX radar covers St. Clair County)
 NWS_RADAR_GIF = "https://radar.weather.gov/ridge/standard/KDTX_loop.gif"
 NWS_RADAR_URL = "https://radar.weather.gov/?settings=v1_eyJhZ2VuZGEiOnsiaWQiOiJsb2NhbCIsImNlbnRlciI6Wy04Mi42NSw0Mi45N10sInpvb20iOjh9fQ%3D%3D"
 
 # Data files
-POSTED_ALERTS_FILE = Path("posted_alerts.json")
+POSTED_ALERTS_FILE = Path("posted_alerts.log")
+LEGACY_POSTED_ALERTS_FILE = Path("posted_alerts.json")
+POSTED_ALERTS_KEEP = 500  # Alert IDs reloaded from the log on startup
+POSTED_ALERTS_CAPACITY = 10000  # Alert IDs the in-memory bloom filter is sized for
+POSTED_ALERTS_ERROR_RATE = 0.001  # False positive rate at capacity
+POSTED_ALERTS_COMPACT_THRESHOLD = 1000  # Rewrite the log once it grows past this many lines
 SERVER_CONFIG_FILE = Path("server_config.json")
 MESSAGE_TRACKING_FILE = Path("message_tracking.json")
 
+# Discord embed limits
+EMBED_FIELD_LIMIT = 1024  # Characters per field value
+EMBED_TOTAL_LIMIT = 6000  # Characters across the whole embed
+
+# Returned by conditional requests when NWS answers 304 Not Modified
+NOT_MODIFIED = object()
+
 # NWS Alert severity colors for embeds
 SEVERITY_COLORS = {
     "Extreme": 0xFF0000,    # Red
@@ -71,6 +96,55 @@ ALERT_EMOJIS = {
 }
 
 
+def _truncate(text: str, limit: int = EMBED_FIELD_LIMIT) -> str:
+    """Shorten text to fit a Discord limit, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> int:
+    """Convert an NWS ISO 8601 timestamp to a Unix timestamp."""
+    # fromisoformat only understands a trailing "Z" from Python 3.11 on
+    if sys.version_info < (3, 11):
+        value = value.replace("Z", "+00:00")
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+class BloomFilter:
+    """Fixed-size set of strings that may report false positives but never false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Double hashing: derive all k bit positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        """Number of add() calls. Callers only add items not already present, so this is
+        the number of distinct items recorded, less any rejected as false positives."""
+        return self.count
+
+
 class NWSAlertBot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
@@ -78,74 +152,138 @@ class NWSAlertBot(commands.Bot):
         super().__init__(command_prefix="!", intents=intents)
         self.posted_alerts = self.load_posted_alerts()
         self.server_config = self.load_server_config()
+        self._alerts_fp = None
+        self._file_lock = asyncio.Lock()  # Serializes data file writes made from worker threads
         self.session = None
+        self._channels = []  # Resolved alert channel objects
+        self._channels_dirty = True  # Rebuild _channels on next use
+        self._cache = {}  # URL -> (expires_at, parsed JSON)
+        self._latest_products = {}  # Product type -> (product URL, parsed product)
+        self._inflight = {}  # URL -> asyncio.Task for a fetch in progress
+        self._validators = {}  # URL -> ETag/Last-Modified request headers for conditional GETs
         self.active_alert_ids = set()  # Track currently active alerts
         message_tracking = self.load_message_tracking()
         self.alert_message_ids = message_tracking.get("alert_messages", {})
         self.all_clear_message_ids = message_tracking.get("all_clear_messages", {})
 
-    def load_posted_alerts(self) -> set:
-        """Load previously posted alert IDs from file."""
-        if POSTED_ALERTS_FILE.exists():
-            try:
-                with open(POSTED_ALERTS_FILE, "r") as f:
-                    data = json.load(f)
-                    # Clean old alerts (keep last 500)
-                    return set(data[-500:])
-            except (json.JSONDecodeError, IOError):
-                return set()
-        return set()
-
-    def save_posted_alerts(self):
-        """Save posted alert IDs to file."""
+    def load_posted_alerts(self) -> BloomFilter:
+        """Load previously posted alert IDs from the append-only log.
+
+        Keeps the most recent IDs and compacts the log if it has grown too large.
+        """
+        if not POSTED_ALERTS_FILE.exists():
+            return self.migrate_legacy_posted_alerts()
+        try:
+            with open(POSTED_ALERTS_FILE, "r") as f:
+                lines = [line.strip() for line in f if line.strip()]
+        except IOError:
+            return BloomFilter(POSTED_ALERTS_CAPACITY, POSTED_ALERTS_ERROR_RATE)
+
+        # Dedupe while preserving order so the newest IDs are kept
+        alert_ids = list(dict.fromkeys(lines))[-POSTED_ALERTS_KEEP:]
+        if len(lines) > POSTED_ALERTS_COMPACT_THRESHOLD:
+            self.write_posted_alerts_log(alert_ids)
+        return self.build_posted_alerts(alert_ids)
+
+    def migrate_legacy_posted_alerts(self) -> BloomFilter:
+        """Convert an old posted_alerts.json file into the append-only log."""
+        if not LEGACY_POSTED_ALERTS_FILE.exists():
+            return BloomFilter(POSTED_ALERTS_CAPACITY, POSTED_ALERTS_ERROR_RATE)
+        try:
+            with open(LEGACY_POSTED_ALERTS_FILE, "rb") as f:
+                alert_ids = orjson.loads(f.read())[-POSTED_ALERTS_KEEP:]
+        except (orjson.JSONDecodeError, IOError):
+            return BloomFilter(POSTED_ALERTS_CAPACITY, POSTED_ALERTS_ERROR_RATE)
+        self.write_posted_alerts_log(alert_ids)
+        return self.build_posted_alerts(alert_ids)
+
+    def build_posted_alerts(self, alert_ids: list[str]) -> BloomFilter:
+        """Build the in-memory posted alert filter from IDs read off disk."""
+        posted = BloomFilter(POSTED_ALERTS_CAPACITY, POSTED_ALERTS_ERROR_RATE)
+        for alert_id in alert_ids:
+            posted.add(alert_id)
+        return posted
+
+    def write_posted_alerts_log(self, alert_ids: list[str]):
+        """Rewrite the posted alerts log with exactly the given IDs."""
         with open(POSTED_ALERTS_FILE, "w") as f:
-            json.dump(list(self.posted_alerts), f)
+            f.writelines(f"{alert_id}\n" for alert_id in alert_ids)
+
+    def track_posted_alert(self, alert_id: str):
+        """Remember a posted alert ID. The on-disk log remains the authoritative record."""
+        self.posted_alerts.add(alert_id)
+
+    async def save_posted_alerts(self, alert_ids: list[str]):
+        """Append newly posted alert IDs to the log without blocking the event loop."""
+        async with self._file_lock:
+            await asyncio.to_thread(self._append_posted_alerts_sync, alert_ids)
+
+    def _append_posted_alerts_sync(self, alert_ids: list[str]):
+        self._alerts_fp.writelines(f"{alert_id}\n" for alert_id in alert_ids)
+        self._alerts_fp.flush()
+
+    async def clear_posted_alerts(self):
+        """Forget all posted alert IDs, both in memory and on disk."""
+        self.posted_alerts.clear()
+        async with self._file_lock:
+            await asyncio.to_thread(self._truncate_posted_alerts_sync)
+
+    def _truncate_posted_alerts_sync(self):
+        self._alerts_fp.seek(0)
+        self._alerts_fp.truncate()
+        self._alerts_fp.flush()
 
     def load_server_config(self) -> dict:
         """Load server configuration from file."""
         if SERVER_CONFIG_FILE.exists():
             try:
-                with open(SERVER_CONFIG_FILE, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(SERVER_CONFIG_FILE, "rb") as f:
+                    return orjson.loads(f.read())
+            except (orjson.JSONDecodeError, IOError):
                 return {}
         return {}
 
-    def save_server_config(self):
-        """Save server configuration to file."""
-        with open(SERVER_CONFIG_FILE, "w") as f:
-            json.dump(self.server_config, f, indent=2)
+    async def save_server_config(self):
+        """Save server configuration to file without blocking the event loop."""
+        # Serialize here so the worker thread never sees the dict mid-update
+        data = orjson.dumps(self.server_config)
+        async with self._file_lock:
+            await asyncio.to_thread(SERVER_CONFIG_FILE.write_bytes, data)
 
     def load_message_tracking(self) -> dict:
         """Load message tracking data from file."""
         if MESSAGE_TRACKING_FILE.exists():
             try:
-                with open(MESSAGE_TRACKING_FILE, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(MESSAGE_TRACKING_FILE, "rb") as f:
+                    return orjson.loads(f.read())
+            except (orjson.JSONDecodeError, IOError):
                 return {}
         return {}
 
-    def save_message_tracking(self):
-        """Save message tracking data to file."""
+    async def save_message_tracking(self):
+        """Save message tracking data to file without blocking the event loop."""
         data = {
             "alert_messages": self.alert_message_ids,
             "all_clear_messages": self.all_clear_message_ids
         }
-        with open(MESSAGE_TRACKING_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        # Channel IDs are int keys in memory; OPT_NON_STR_KEYS writes them as strings like json did
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        async with self._file_lock:
+            await asyncio.to_thread(MESSAGE_TRACKING_FILE.write_bytes, payload)
 
-    def set_alert_channel(self, guild_id: int, channel_id: int):
+    async def set_alert_channel(self, guild_id: int, channel_id: int):
         """Set the alert channel for a server."""
         self.server_config[str(guild_id)] = {"alert_channel_id": channel_id}
-        self.save_server_config()
+        self._channels_dirty = True
+        await self.save_server_config()
 
-    def remove_alert_channel(self, guild_id: int):
+    async def remove_alert_channel(self, guild_id: int):
         """Remove the alert channel configuration for a server."""
         guild_key = str(guild_id)
         if guild_key in self.server_config:
             del self.server_config[guild_key]
-            self.save_server_config()
+            self._channels_dirty = True
+            await self.save_server_config()
             return True
         return False
 
@@ -165,11 +303,44 @@ class NWSAlertBot(commands.Bot):
                 channels.append(channel_id)
         return channels
 
+    def get_alert_channel_objects(self) -> list[discord.TextChannel]:
+        """Get the resolved alert channels, rebuilding the list only after config or guild changes.
+
+        Stays dirty while any configured channel can't be resolved, so channels in guilds
+        that were unavailable or uncached get picked up again on a later check.
+        """
+        if self._channels_dirty:
+            self._channels = []
+            all_resolved = True
+            for channel_id in self.get_all_alert_channels():
+                channel = self.get_channel(channel_id)
+                if channel:
+                    self._channels.append(channel)
+                else:
+                    all_resolved = False
+                    print(f"Could not find channel with ID {channel_id}")
+            self._channels_dirty = not all_resolved
+        return self._channels
+
     async def setup_hook(self):
         """Called when the bot is starting up."""
+        # Keep connections alive longer than the poll interval so each check reuses
+        # the existing TLS connection instead of handshaking again
+        connector = aiohttp.TCPConnector(
+            limit=20,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=30, connect=10)
         self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            json_serialize=lambda obj: orjson.dumps(obj).decode(),
             headers={"User-Agent": "(NWSStClairBot, Discord Weather Alert Bot)"}
         )
+        self._alerts_fp = open(POSTED_ALERTS_FILE, "a")
         self.check_alerts.start()
 
         # Sync slash commands
@@ -193,9 +364,12 @@ class NWSAlertBot(commands.Bot):
         self.check_alerts.cancel()
         if self.session:
             await self.session.close()
+        if self._alerts_fp:
+            self._alerts_fp.close()
         await super().close()
 
     async def on_ready(self):
+        self._channels_dirty = True
         print(f"Bot is ready! Logged in as {self.user}")
         print(f"Monitoring NWS alerts for zone: {NWS_ZONE}")
         print(f"Connected to {len(self.guilds)} server(s)")
@@ -203,35 +377,151 @@ class NWSAlertBot(commands.Bot):
         for guild in self.guilds:
             print(f"  - {guild.name} (ID: {guild.id})")
 
-    async def fetch_alerts(self) -> list | None:
+    async def on_guild_join(self, guild: discord.Guild):
+        self._channels_dirty = True
+
+    async def on_guild_available(self, guild: discord.Guild):
+        self._channels_dirty = True
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._channels_dirty = True
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self._channels_dirty = True
+
+    async def _request(self, url: str, retries: int = NWS_RETRY_ATTEMPTS, conditional: bool = False):
+        """GET a JSON document from NWS, retrying transient failures.
+
+        Throttling, server errors and network errors are retried with full-jitter
+        exponential backoff. Returns the parsed JSON on success, None on failure.
+
+        With conditional=True the ETag/Last-Modified of the previous response is sent
+        back, and NOT_MODIFIED is returned if the document hasn't changed since.
+        """
+        headers = self._validators.get(url, {}) if conditional else {}
+        for attempt in range(retries):
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 304 and conditional:
+                        return NOT_MODIFIED
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        if conditional:
+                            self._remember_validators(url, response.headers)
+                        return data
+                    if response.status not in NWS_RETRYABLE_STATUSES:
+                        print(f"NWS API returned status {response.status} for {url}")
+                        return None
+                    print(f"NWS API returned status {response.status} for {url} (attempt {attempt + 1}/{retries})")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Error fetching {url} (attempt {attempt + 1}/{retries}): {e}")
+
+            if attempt < retries - 1:
+                await asyncio.sleep(random.uniform(0, min(NWS_RETRY_MAX_DELAY, 2 ** attempt)))
+        return None
+
+    def _remember_validators(self, url: str, response_headers):
+        """Store the cache validators from a response for the next conditional GET."""
+        validators = {}
+        if "ETag" in response_headers:
+            validators["If-None-Match"] = response_headers["ETag"]
+        if "Last-Modified" in response_headers:
+            validators["If-Modified-Since"] = response_headers["Last-Modified"]
+        if validators:
+            self._validators[url] = validators
+        else:
+            self._validators.pop(url, None)
+
+    def forget_alert_validators(self):
+        """Make the next alert check fetch and process the full alert list."""
+        self._validators.pop(f"{NWS_API_BASE}/alerts/active/zone/{NWS_ZONE}", None)
+
+    async def fetch_alerts(self, conditional: bool = False) -> list | None:
         """Fetch current alerts from NWS API for our zone.
 
-        Returns list of alerts on success, None on API error.
+        Returns list of alerts on success, None on API error. With conditional=True,
+        returns NOT_MODIFIED if the alerts haven't changed since the last conditional fetch.
         """
         url = f"{NWS_API_BASE}/alerts/active/zone/{NWS_ZONE}"
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("features", [])
-                else:
-                    print(f"NWS API returned status {response.status}")
-                    return None  # Return None on error, not empty list
+            data = await self._request(url, conditional=conditional)
+            if data is None:
+                return None  # Return None on error, not empty list
+            if data is NOT_MODIFIED:
+                return NOT_MODIFIED
+            return data.get("features", [])
         except Exception as e:
             print(f"Error fetching alerts: {e}")
             return None  # Return None on error, not empty list
 
+    async def _cached_get(self, url: str, ttl: float):
+        """GET a JSON document from NWS, reusing a copy fetched within the last ttl seconds.
+
+        Returns the parsed JSON on success, None if the request failed.
+        """
+        cached = self._cache.get(url)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # Run the fetch as its own task so cancelling any caller, including the one
+        # that started it, never cancels the request the others are waiting on
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(url, ttl))
+            self._inflight[url] = task
+            task.add_done_callback(lambda t: self._finish_inflight(url, t))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, url: str, ttl: float):
+        """Fetch a URL for _cached_get and store a successful result in the cache."""
+        data = await self._request(url)
+        if data is not None:
+            now = time.monotonic()
+            # Drop expired entries so superseded product URLs don't pile up
+            for stale_url in [u for u, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                del self._cache[stale_url]
+            self._cache[url] = (now + ttl, data)
+        return data
+
+    def _finish_inflight(self, url: str, task: asyncio.Task):
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        # Mark any exception retrieved in case every caller was cancelled before it arrived
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_latest_product(self, product_type: str) -> dict:
+        """Fetch the latest issued text product of the given type for our office."""
+        url = f"{NWS_API_BASE}/products/types/{product_type}/locations/{NWS_OFFICE}"
+        data = await self._cached_get(url, PRODUCT_CACHE_TTL)
+        if not data:
+            return {}
+        products = data.get("@graph", [])
+        if not products:
+            return {}
+        latest_url = products[0].get("@id", "")
+        if not latest_url:
+            return {}
+
+        # Issued products never change, so reuse the last body while it's still the latest
+        last = self._latest_products.get(product_type)
+        if last and last[0] == latest_url:
+            return last[1]
+
+        product = await self._cached_get(latest_url, PRODUCT_CACHE_TTL)
+        if not product:
+            return {}
+        self._latest_products[product_type] = (latest_url, product)
+        return product
+
     async def fetch_forecast(self) -> list:
         """Fetch the 7-day forecast from NWS API."""
         url = f"{NWS_API_BASE}/gridpoints/{NWS_OFFICE}/{NWS_GRID_X},{NWS_GRID_Y}/forecast"
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("properties", {}).get("periods", [])
-                else:
-                    print(f"NWS Forecast API returned status {response.status}")
-                    return []
+            data = await self._cached_get(url, FORECAST_CACHE_TTL)
+            if data is None:
+                return []
+            return data.get("properties", {}).get("periods", [])
         except Exception as e:
             print(f"Error fetching forecast: {e}")
             return []
@@ -240,55 +530,26 @@ class NWSAlertBot(commands.Bot):
         """Fetch the hourly forecast from NWS API."""
         url = f"{NWS_API_BASE}/gridpoints/{NWS_OFFICE}/{NWS_GRID_X},{NWS_GRID_Y}/forecast/hourly"
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("properties", {}).get("periods", [])
-                else:
-                    print(f"NWS Hourly Forecast API returned status {response.status}")
-                    return []
+            data = await self._cached_get(url, FORECAST_CACHE_TTL)
+            if data is None:
+                return []
+            return data.get("properties", {}).get("periods", [])
         except Exception as e:
             print(f"Error fetching hourly forecast: {e}")
             return []
 
     async def fetch_discussion(self) -> dict:
         """Fetch the Area Forecast Discussion from NWS API."""
-        url = f"{NWS_API_BASE}/products/types/AFD/locations/{NWS_OFFICE}"
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    products = data.get("@graph", [])
-                    if products:
-                        # Get the latest discussion
-                        latest_url = products[0].get("@id", "")
-                        if latest_url:
-                            async with self.session.get(latest_url) as prod_response:
-                                if prod_response.status == 200:
-                                    prod_data = await prod_response.json()
-                                    return prod_data
-                return {}
+            return await self._fetch_latest_product("AFD")
         except Exception as e:
             print(f"Error fetching discussion: {e}")
             return {}
 
     async def fetch_hazardous_outlook(self) -> dict:
         """Fetch the Hazardous Weather Outlook from NWS API."""
-        url = f"{NWS_API_BASE}/products/types/HWO/locations/{NWS_OFFICE}"
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    products = data.get("@graph", [])
-                    if products:
-                        # Get the latest outlook
-                        latest_url = products[0].get("@id", "")
-                        if latest_url:
-                            async with self.session.get(latest_url) as prod_response:
-                                if prod_response.status == 200:
-                                    prod_data = await prod_response.json()
-                                    return prod_data
-                return {}
+            return await self._fetch_latest_product("HWO")
         except Exception as e:
             print(f"Error fetching hazardous outlook: {e}")
             return {}
@@ -315,9 +576,10 @@ class NWSAlertBot(commands.Bot):
 
         event = props.get("event", "Unknown Alert")
         severity = props.get("severity", "Unknown")
-        headline = props.get("headline", "No headline available")
-        description = props.get("description", "No description available")
-        instruction = props.get("instruction", "")
+        # NWS sends null for missing text fields, so normalise before measuring them
+        headline = props.get("headline") or "No headline available"
+        description = props.get("description") or "No description available"
+        instruction = props.get("instruction") or ""
 
         # Parse times
         effective = props.get("effective", "")
@@ -337,23 +599,25 @@ class NWSAlertBot(commands.Bot):
             timestamp=datetime.now(timezone.utc)
         )
 
-        # Truncate description if too long (Discord limit is 4096 for embed description)
-        if len(description) > 1024:
-            description = description[:1021] + "..."
-        embed.add_field(name="Description", value=description, inline=False)
+        instruction = _truncate(instruction)
+
+        # Spread long descriptions over up to 4 fields instead of dropping the tail,
+        # leaving ~600 characters for the title, time/severity/radar fields and footer
+        room = EMBED_TOTAL_LIMIT - 600 - len(embed.title) - len(headline) - len(instruction)
+        description = _truncate(description, max(EMBED_FIELD_LIMIT, min(4 * EMBED_FIELD_LIMIT, room)))
+        for i in range(0, len(description), EMBED_FIELD_LIMIT):
+            field_name = "Description" if i == 0 else "\u200b"  # Invisible character for continuation
+            embed.add_field(name=field_name, value=description[i:i + EMBED_FIELD_LIMIT], inline=False)
 
         if instruction:
-            if len(instruction) > 1024:
-                instruction = instruction[:1021] + "..."
             embed.add_field(name="Instructions", value=instruction, inline=False)
 
         # Format times
         if effective:
             try:
-                eff_dt = datetime.fromisoformat(effective.replace("Z", "+00:00"))
                 embed.add_field(
                     name="Effective",
-                    value=f"<t:{int(eff_dt.timestamp())}:F>",
+                    value=f"<t:{_parse_iso(effective)}:F>",
                     inline=True
                 )
             except ValueError:
@@ -361,10 +625,9 @@ class NWSAlertBot(commands.Bot):
 
         if expires:
             try:
-                exp_dt = datetime.fromisoformat(expires.replace("Z", "+00:00"))
                 embed.add_field(
                     name="Expires",
-                    value=f"<t:{int(exp_dt.timestamp())}:F>",
+                    value=f"<t:{_parse_iso(expires)}:F>",
                     inline=True
                 )
             except ValueError:
@@ -390,19 +653,33 @@ class NWSAlertBot(commands.Bot):
     @tasks.loop(seconds=CHECK_INTERVAL_SECONDS)
     async def check_alerts(self):
         """Periodically check for new alerts and post them to all configured channels."""
-        # Get all configured alert channels
-        alert_channels = self.get_all_alert_channels()
-
-        if not alert_channels:
+        if not self.server_config:
             return  # No channels configured yet
 
-        alerts = await self.fetch_alerts()
+        alerts = await self.fetch_alerts(conditional=True)
+
+        # Nothing has changed since the last check, so there is nothing to post or clear
+        if alerts is NOT_MODIFIED:
+            return
 
         # If API error, skip this cycle entirely - don't trigger false all-clear
         if alerts is None:
             print("Skipping alert check due to API error")
             return
 
+        # No alerts now and none before - nothing to post or clear
+        if not alerts and not self.active_alert_ids:
+            return
+
+        # Get all configured alert channels
+        alert_channels = self.get_alert_channel_objects()
+        if not alert_channels:
+            # Look the channels up again next check, and fetch these alerts in full
+            # then so they still get posted once a channel is reachable
+            self._channels_dirty = True
+            self.forget_alert_validators()
+            return
+
         # Get current active alert IDs
         current_alert_ids = set()
         for alert in alerts:
@@ -415,6 +692,7 @@ class NWSAlertBot(commands.Bot):
             await self.post_all_clear(alert_channels)
 
         # Update active alerts tracking
+        previous_alert_ids = self.active_alert_ids
         self.active_alert_ids = current_alert_ids
 
         # Track if we have any new alerts to post
@@ -428,9 +706,18 @@ class NWSAlertBot(commands.Bot):
         if has_new_alerts:
             await self.delete_all_clear_messages(alert_channels)
 
+        # Fetch the radar image once for every alert posted this tick
+        radar_data = await self.fetch_radar_image() if has_new_alerts else None
+
+        newly_posted = []
         for alert in alerts:
             alert_id = alert.get("properties", {}).get("id", "")
 
+            # An alert we didn't see last check but which the filter says was posted is
+            # either from before a restart or a bloom filter false positive - log it either way
+            if alert_id and alert_id in self.posted_alerts and alert_id not in previous_alert_ids:
+                print(f"Skipping alert already marked as posted (or a filter false positive): {alert_id}")
+
             if alert_id and alert_id not in self.posted_alerts:
                 # New alert - post it to all configured channels!
                 embed = self.create_alert_embed(alert)
@@ -445,44 +732,53 @@ class NWSAlertBot(commands.Bot):
                 if severity == "Extreme" or event in ping_events:
                     content = "@everyone **SEVERE WEATHER ALERT**"
 
-                # Fetch radar image to attach
-                radar_data = await self.fetch_radar_image()
+                # Post to all configured channels concurrently
+                sends = []
+                for channel in alert_channels:
+                    # Each send needs its own file attachment since discord.File is consumed on upload
+                    if radar_data:
+                        radar_file = discord.File(io.BytesIO(radar_data), filename="radar.gif")
+                        sends.append(channel.send(content=content, embed=embed, file=radar_file))
+                    else:
+                        sends.append(channel.send(content=content, embed=embed))
+                results = await asyncio.gather(*sends, return_exceptions=True)
 
-                # Post to all configured channels
                 posted_successfully = False
-                for channel_id in alert_channels:
-                    channel = self.get_channel(channel_id)
-                    if channel:
-                        try:
-                            # Create file attachment for radar if available
-                            if radar_data:
-                                radar_file = discord.File(io.BytesIO(radar_data), filename="radar.gif")
-                                message = await channel.send(content=content, embed=embed, file=radar_file)
-                            else:
-                                message = await channel.send(content=content, embed=embed)
-                            posted_successfully = True
-                            # Track message ID for later deletion
-                            if channel_id not in self.alert_message_ids:
-                                self.alert_message_ids[channel_id] = []
-                            self.alert_message_ids[channel_id].append(message.id)
-                            self.save_message_tracking()
-                            print(f"Posted alert to {channel.guild.name}: {event}")
-                        except discord.DiscordException as e:
-                            print(f"Error posting alert to channel {channel_id}: {e}")
-                    else:
-                        print(f"Could not find channel with ID {channel_id}")
+                for channel, result in zip(alert_channels, results):
+                    channel_id = channel.id
+                    if isinstance(result, discord.DiscordException):
+                        print(f"Error posting alert to channel {channel_id}: {result}")
+                        continue
+                    if isinstance(result, Exception):
+                        print(f"Unexpected error posting alert to channel {channel_id}: {result}")
+                        continue
+                    posted_successfully = True
+                    # Track message ID for later deletion
+                    if channel_id not in self.alert_message_ids:
+                        self.alert_message_ids[channel_id] = []
+                    self.alert_message_ids[channel_id].append(result.id)
+                    print(f"Posted alert to {channel.guild.name}: {event}")
 
                 # Only mark as posted if at least one channel received it
                 if posted_successfully:
-                    self.posted_alerts.add(alert_id)
-                    self.save_posted_alerts()
-                    print(f"Alert tracked: {alert_id}")
+                    self.track_posted_alert(alert_id)
+                    newly_posted.append(alert_id)
+
+        # Persist everything posted this tick in one write per file
+        if newly_posted:
+            await self.save_message_tracking()
+            await self.save_posted_alerts(newly_posted)
+            print(f"Tracked {len(newly_posted)} new alert(s): {', '.join(newly_posted)}")
+
+        # If any alert failed to post, refetch in full next time so it gets retried
+        if any(alert_id not in self.posted_alerts for alert_id in current_alert_ids):
+            self.forget_alert_validators()
 
-    async def delete_all_clear_messages(self, alert_channels: list[int]):
+    async def delete_all_clear_messages(self, alert_channels: list[discord.TextChannel]):
         """Delete any previously posted all-clear messages."""
-        for channel_id in alert_channels:
-            channel = self.get_channel(channel_id)
-            if channel and channel_id in self.all_clear_message_ids:
+        for channel in alert_channels:
+            channel_id = channel.id
+            if channel_id in self.all_clear_message_ids:
                 for message_id in self.all_clear_message_ids[channel_id]:
                     try:
                         message = await channel.fetch_message(message_id)
@@ -494,14 +790,14 @@ class NWSAlertBot(commands.Bot):
                         print(f"Error deleting all-clear message {message_id}: {e}")
         # Clear tracked all-clear message IDs
         self.all_clear_message_ids.clear()
-        self.save_message_tracking()
+        await self.save_message_tracking()
 
-    async def post_all_clear(self, alert_channels: list[int]):
+    async def post_all_clear(self, alert_channels: list[discord.TextChannel]):
         """Post an all-clear message when all weather alerts have expired."""
         # Delete previous alert messages from each channel
-        for channel_id in alert_channels:
-            channel = self.get_channel(channel_id)
-            if channel and channel_id in self.alert_message_ids:
+        for channel in alert_channels:
+            channel_id = channel.id
+            if channel_id in self.alert_message_ids:
                 for message_id in self.alert_message_ids[channel_id]:
                     try:
                         message = await channel.fetch_message(message_id)
@@ -514,7 +810,7 @@ class NWSAlertBot(commands.Bot):
 
         # Clear tracked message IDs
         self.alert_message_ids.clear()
-        self.save_message_tracking()
+        await self.save_message_tracking()
 
         # Post the all-clear embed
         embed = discord.Embed(
@@ -535,24 +831,25 @@ class NWSAlertBot(commands.Bot):
         # Fetch radar image to attach
         radar_data = await self.fetch_radar_image()
 
-        for channel_id in alert_channels:
-            channel = self.get_channel(channel_id)
-            if channel:
-                try:
-                    # Create file attachment for radar if available
-                    if radar_data:
-                        radar_file = discord.File(io.BytesIO(radar_data), filename="radar.gif")
-                        message = await channel.send(embed=embed, file=radar_file)
-                    else:
-                        message = await channel.send(embed=embed)
-                    # Track all-clear message ID for later deletion
-                    if channel_id not in self.all_clear_message_ids:
-                        self.all_clear_message_ids[channel_id] = []
-                    self.all_clear_message_ids[channel_id].append(message.id)
-                    self.save_message_tracking()
-                    print(f"Posted all-clear to {channel.guild.name}")
-                except discord.DiscordException as e:
-                    print(f"Error posting all-clear to channel {channel_id}: {e}")
+        for channel in alert_channels:
+            channel_id = channel.id
+            try:
+                # Create file attachment for radar if available
+                if radar_data:
+                    radar_file = discord.File(io.BytesIO(radar_data), filename="radar.gif")
+                    message = await channel.send(embed=embed, file=radar_file)
+                else:
+                    message = await channel.send(embed=embed)
+                # Track all-clear message ID for later deletion
+                if channel_id not in self.all_clear_message_ids:
+                    self.all_clear_message_ids[channel_id] = []
+                self.all_clear_message_ids[channel_id].append(message.id)
+                print(f"Posted all-clear to {channel.guild.name}")
+            except discord.DiscordException as e:
+                print(f"Error posting all-clear to channel {channel_id}: {e}")
+
+        if self.all_clear_message_ids:
+            await self.save_message_tracking()
 
     @check_alerts.before_loop
     async def before_check_alerts(self):
@@ -598,16 +895,47 @@ WEATHER_EMOJIS = {
     "cold": "\U0001F976",
 }
 
+# Longest keywords first so "mostly sunny" matches before "sunny"
+_WEATHER_KEYWORDS = sorted(WEATHER_EMOJIS, key=len, reverse=True)
+_WEATHER_RE = re.compile("|".join(re.escape(k) for k in _WEATHER_KEYWORDS), re.IGNORECASE)
+
+# AFD synopsis: everything after the ".SYNOPSIS..." header up to the next ".SECTION" line
+_SYNOPSIS_RE = re.compile(r"\.SYNOPSIS[^\n]*\n(.*?)(?=\n\.|\Z)", re.DOTALL | re.IGNORECASE)
+
 
 def get_weather_emoji(forecast_text: str) -> str:
     """Get an appropriate emoji for the weather condition."""
-    text_lower = forecast_text.lower()
-    for keyword, emoji in WEATHER_EMOJIS.items():
-        if keyword in text_lower:
-            return emoji
+    match = _WEATHER_RE.search(forecast_text)
+    if match:
+        return WEATHER_EMOJIS[match.group(0).lower()]
     return "\U0001F324\uFE0F"  # Default
 
 
+# Canned responses and embed templates, copied per command so only the
+# timestamp and fields need to be filled in
+NO_ALERTS_MSG = "No active weather alerts for St. Clair County at this time."
+
+FORECAST_EMBED = discord.Embed(
+    title="\U0001F324\uFE0F Weather Forecast - St. Clair County, MI",
+    color=0x3498DB
+).set_footer(text="Source: National Weather Service")
+
+HOURLY_EMBED = discord.Embed(
+    title="\u23F0 Hourly Forecast - St. Clair County, MI",
+    color=0x9B59B6
+).set_footer(text="Source: National Weather Service")
+
+OUTLOOK_EMBED = discord.Embed(
+    title="\u26A0\uFE0F Hazardous Weather Outlook",
+    color=0xE74C3C
+).set_footer(text=f"Source: NWS {NWS_OFFICE}")
+
+DISCUSSION_EMBED = discord.Embed(
+    title="\U0001F4DD Area Forecast Discussion",
+    color=0x2ECC71
+).set_footer(text=f"Source: NWS {NWS_OFFICE}")
+
+
 # Slash Commands
 @bot.tree.command(name="alerts", description="Show current active weather alerts for St. Clair County")
 async def slash_alerts(interaction: discord.Interaction):
@@ -617,7 +945,7 @@ async def slash_alerts(interaction: discord.Interaction):
     alerts = await bot.fetch_alerts()
 
     if not alerts:
-        await interaction.followup.send("No active weather alerts for St. Clair County at this time.")
+        await interaction.followup.send(NO_ALERTS_MSG)
         return
 
     await interaction.followup.send(f"**{len(alerts)} Active Alert(s) for St. Clair County:**")
@@ -646,15 +974,11 @@ async def slash_forecast(interaction: discord.Interaction, days: int = 6):
 
     # Limit days
     days = min(max(days, 1), 14)
-    periods = periods[:days]
 
-    embed = discord.Embed(
-        title=f"\U0001F324\uFE0F Weather Forecast - St. Clair County, MI",
-        color=0x3498DB,
-        timestamp=datetime.now(timezone.utc)
-    )
+    embed = FORECAST_EMBED.copy()
+    embed.timestamp = datetime.now(timezone.utc)
 
-    for period in periods:
+    for period in itertools.islice(periods, days):
         name = period.get("name", "Unknown")
         temp = period.get("temperature", "?")
         temp_unit = period.get("temperatureUnit", "F")
@@ -669,7 +993,6 @@ async def slash_forecast(interaction: discord.Interaction, days: int = 6):
 
         embed.add_field(name=name, value=value, inline=False)
 
-    embed.set_footer(text="Source: National Weather Service")
     await interaction.followup.send(embed=embed)
 
 
@@ -687,36 +1010,28 @@ async def slash_hourly(interaction: discord.Interaction, hours: int = 12):
 
     # Limit hours
     hours = min(max(hours, 1), 24)
-    periods = periods[:hours]
 
-    embed = discord.Embed(
-        title=f"\u23F0 Hourly Forecast - St. Clair County, MI",
-        color=0x9B59B6,
-        timestamp=datetime.now(timezone.utc)
-    )
+    embed = HOURLY_EMBED.copy()
+    embed.timestamp = datetime.now(timezone.utc)
 
-    forecast_text = ""
-    for period in periods:
+    parts = []
+    for period in itertools.islice(periods, hours):
         start_time = period.get("startTime", "")
         temp = period.get("temperature", "?")
         short_forecast = period.get("shortForecast", "")
 
         # Parse and format time
         try:
-            dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            time_str = f"<t:{int(dt.timestamp())}:t>"
-        except (ValueError, AttributeError):
+            time_str = f"<t:{_parse_iso(start_time)}:t>"
+        except (ValueError, TypeError):
             time_str = "Unknown"
 
         emoji = get_weather_emoji(short_forecast)
-        forecast_text += f"{time_str}: {emoji} **{temp}\u00B0F** - {short_forecast}\n"
+        parts.append(f"{time_str}: {emoji} **{temp}\u00B0F** - {short_forecast}\n")
+    forecast_text = "".join(parts)
 
-    # Split into chunks if too long
-    if len(forecast_text) > 4096:
-        forecast_text = forecast_text[:4093] + "..."
-
-    embed.description = forecast_text
-    embed.set_footer(text="Source: National Weather Service")
+    # Embed descriptions are limited to 4096 characters
+    embed.description = _truncate(forecast_text, 4096)
     await interaction.followup.send(embed=embed)
 
 
@@ -738,23 +1053,18 @@ async def slash_outlook(interaction: discord.Interaction):
     time_str = ""
     if issue_time:
         try:
-            dt = datetime.fromisoformat(issue_time.replace("Z", "+00:00"))
-            time_str = f"Issued: <t:{int(dt.timestamp())}:F>"
+            time_str = f"Issued: <t:{_parse_iso(issue_time)}:F>"
         except ValueError:
             time_str = f"Issued: {issue_time}"
 
-    embed = discord.Embed(
-        title="\u26A0\uFE0F Hazardous Weather Outlook",
-        color=0xE74C3C,
-        timestamp=datetime.now(timezone.utc)
-    )
+    embed = OUTLOOK_EMBED.copy()
+    embed.timestamp = datetime.now(timezone.utc)
 
     if time_str:
         embed.description = time_str
 
-    # Truncate if too long and split into fields
-    if len(product_text) > 4000:
-        product_text = product_text[:4000] + "..."
+    # Truncate to what fits in 4 fields
+    product_text = _truncate(product_text, 4 * EMBED_FIELD_LIMIT)
 
     # Split into chunks of 1024 for fields
     chunks = [product_text[i:i+1024] for i in range(0, len(product_text), 1024)]
@@ -762,7 +1072,6 @@ async def slash_outlook(interaction: discord.Interaction):
         field_name = "Outlook" if i == 0 else "\u200b"  # Invisible character for continuation
         embed.add_field(name=field_name, value=chunk, inline=False)
 
-    embed.set_footer(text=f"Source: NWS {NWS_OFFICE}")
     await interaction.followup.send(embed=embed)
 
 
@@ -784,34 +1093,18 @@ async def slash_discussion(interaction: discord.Interaction):
     time_str = ""
     if issue_time:
         try:
-            dt = datetime.fromisoformat(issue_time.replace("Z", "+00:00"))
-            time_str = f"Issued: <t:{int(dt.timestamp())}:F>"
+            time_str = f"Issued: <t:{_parse_iso(issue_time)}:F>"
         except ValueError:
             time_str = f"Issued: {issue_time}"
 
-    embed = discord.Embed(
-        title="\U0001F4DD Area Forecast Discussion",
-        description=time_str if time_str else None,
-        color=0x2ECC71,
-        timestamp=datetime.now(timezone.utc)
-    )
-
-    # AFDs are long - extract key sections or truncate
-    # Try to extract the synopsis section
-    lines = product_text.split("\n")
-    synopsis = []
-    in_synopsis = False
-
-    for line in lines:
-        if ".SYNOPSIS" in line.upper() or "SYNOPSIS" in line.upper():
-            in_synopsis = True
-            continue
-        elif line.startswith(".") and in_synopsis:
-            break
-        elif in_synopsis:
-            synopsis.append(line)
+    embed = DISCUSSION_EMBED.copy()
+    embed.timestamp = datetime.now(timezone.utc)
+    if time_str:
+        embed.description = time_str
 
-    synopsis_text = "\n".join(synopsis).strip()[:1024] if synopsis else product_text[:1024]
+    # AFDs are long - extract the synopsis section or truncate
+    match = _SYNOPSIS_RE.search(product_text)
+    synopsis_text = (match.group(1).strip() if match else product_text)[:1024]
 
     if synopsis_text:
         embed.add_field(name="Synopsis", value=synopsis_text or "See full discussion", inline=False)
@@ -823,7 +1116,6 @@ async def slash_discussion(interaction: discord.Interaction):
         inline=False
     )
 
-    embed.set_footer(text=f"Source: NWS {NWS_OFFICE}")
     await interaction.followup.send(embed=embed)
 
 
@@ -840,7 +1132,7 @@ async def slash_status(interaction: discord.Interaction):
     embed.add_field(name="Check Interval", value=f"Every {CHECK_INTERVAL_SECONDS} seconds", inline=True)
     embed.add_field(name="Servers Connected", value=str(len(bot.guilds)), inline=True)
     embed.add_field(name="Channels Configured", value=str(len(bot.server_config)), inline=True)
-    embed.add_field(name="Alerts Tracked", value=str(len(bot.posted_alerts)), inline=True)
+    embed.add_field(name="Alert IDs Recorded", value=str(len(bot.posted_alerts)), inline=True)
     embed.add_field(name="Bot Latency", value=f"{round(bot.latency * 1000)}ms", inline=True)
     await interaction.response.send_message(embed=embed)
 
@@ -896,7 +1188,7 @@ async def slash_setchannel(interaction: discord.Interaction, channel: discord.Te
             )
             return
 
-        bot.set_alert_channel(interaction.guild.id, channel.id)
+        await bot.set_alert_channel(interaction.guild.id, channel.id)
 
         embed = discord.Embed(
             title="\u2705 Alert Channel Configured",
@@ -925,7 +1217,7 @@ async def slash_removechannel(interaction: discord.Interaction):
         )
         return
 
-    if bot.remove_alert_channel(interaction.guild.id):
+    if await bot.remove_alert_channel(interaction.guild.id):
         embed = discord.Embed(
             title="\u274C Alerts Disabled",
             description="This server will no longer receive weather alerts.",
@@ -973,12 +1265,12 @@ async def slash_reset(interaction: discord.Interaction):
     await interaction.response.defer()
 
     # Clear all tracking data
-    bot.posted_alerts.clear()
-    bot.save_posted_alerts()
+    await bot.clear_posted_alerts()
     bot.alert_message_ids.clear()
     bot.all_clear_message_ids.clear()
     bot.active_alert_ids.clear()
-    bot.save_message_tracking()
+    bot.forget_alert_validators()
+    await bot.save_message_tracking()
 
     # Trigger immediate alert check
     await bot.check_alerts()